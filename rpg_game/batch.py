@@ -0,0 +1,108 @@
+"""
+Batch combat module for the RPG game.
+
+This module contains the CharacterBatch class, which stores many characters'
+stats as parallel NumPy arrays so that large fights can be simulated without
+a Python loop per attack.
+
+This module is optional: the game itself never imports it, and it is the only
+part of the project that needs a third-party package. Install NumPy with
+`pip install numpy` before using it.
+"""
+from typing import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from rpg_game.character import Character, LEVEL_UP_EXP, EXP_MULTIPLIER
+
+
+class CharacterBatch:
+    """
+    Represents a group of characters stored as a structure of arrays.
+
+    Each stat is kept in its own array, indexed by character position, instead
+    of one Character object per fighter.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Initialize a new CharacterBatch with all stats set to zero.
+
+        Args:
+            size: The number of characters in the batch
+        """
+        self.health = np.zeros(size, np.int64)
+        self.damage = np.zeros(size, np.int64)
+        self.weapon_damage = np.zeros(size, np.int64)
+        self.level = np.ones(size, np.int64)
+        self.experience = np.zeros(size, np.int64)
+
+    @classmethod
+    def from_characters(cls, characters: Iterable[Character]) -> 'CharacterBatch':
+        """
+        Create a batch from existing characters.
+
+        Args:
+            characters: The characters to copy stats from
+
+        Returns:
+            A new CharacterBatch holding the characters' stats
+        """
+        characters = list(characters)
+        batch = cls(len(characters))
+        for i, character in enumerate(characters):
+            batch.health[i] = character.health
+            batch.damage[i] = character.damage
+            batch.weapon_damage[i] = character.weapon.damage if character.weapon else 0
+            batch.level[i] = character.level
+            batch.experience[i] = character.experience
+        return batch
+
+    def __len__(self) -> int:
+        """Return the number of characters in the batch."""
+        return len(self.health)
+
+    def attack(
+        self, defender: 'CharacterBatch', atk_idx: npt.ArrayLike, def_idx: npt.ArrayLike
+    ) -> np.ndarray:
+        """
+        Have attackers in this batch hit defenders in another batch.
+
+        Attacks are paired element-wise; a defender may appear more than once
+        in def_idx and takes the damage of every attack aimed at it.
+
+        Args:
+            defender: The batch being attacked
+            atk_idx: Indices of the attacking characters in this batch
+            def_idx: Indices of the defending characters in the defender batch
+
+        Returns:
+            A boolean array marking which defenders now have zero health
+        """
+        total_damage = self.damage[atk_idx] + self.weapon_damage[atk_idx]
+        np.subtract.at(defender.health, def_idx, total_damage)
+        np.clip(defender.health, 0, None, out=defender.health)
+        return defender.health <= 0
+
+    def gain_experience(self, amount: npt.ArrayLike) -> np.ndarray:
+        """
+        Give experience to every character and apply any level-ups.
+
+        Args:
+            amount: Experience to add, either a single value or one per character;
+                fractional amounts are truncated
+
+        Returns:
+            A boolean array marking which characters leveled up
+        """
+        self.experience += np.maximum(np.asarray(amount, np.int64), 0)
+        levels, self.experience = np.divmod(self.experience, LEVEL_UP_EXP)
+        leveled_up = levels > 0
+        # Truncate after every level, matching Character.gain_experience
+        for step in range(int(levels.max(initial=0))):
+            mask = levels > step
+            self.health[mask] = (self.health[mask] * EXP_MULTIPLIER).astype(np.int64)
+            self.damage[mask] = (self.damage[mask] * EXP_MULTIPLIER).astype(np.int64)
+        self.level += levels
+        return leveled_up
@@ -1,15 +1,14 @@
 """
 Character module for the RPG game.
 
-This module contains the Character base class and the Boss subclass.
+This module contains the Character base class and its Boss, Sidekick and
+Villain subclasses.
 """
 import sys
-import os
+from enum import IntEnum
+from functools import lru_cache
 from typing import Optional, Union
 
-# Add the project directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from rpg_game.inventory import Weapon, Inventory
 from rpg_game.utils.logger import GameLogger
 
@@ -17,13 +16,71 @@ from rpg_game.utils.logger import GameLogger
 LEVEL_UP_EXP = 100  # Experience needed to level up
 EXP_MULTIPLIER = 1.2  # Multiplier for stats when leveling up
 
+# Message logged for each level gained
+_LEVELUP_TPL = (
+    "{name} leveled up to level {lvl}!\n"
+    "New stats: Health={h}, Damage={d}\n"
+    "Remaining experience: {rem}"
+)
+
+
+class Kind(IntEnum):
+    """The kind of a character, used to pick its ability message."""
+    HERO = 0
+    BOSS = 1
+    SIDEKICK = 2
+    VILLAIN = 3
+
+
+# Ability message templates per Kind: (with an ability, without one)
+_ABILITY_MESSAGES = {
+    Kind.HERO: ("{name} uses {ability}!", "{name} has no ability."),
+    Kind.BOSS: ("{name} uses {ability}!", "{name} has no special ability."),
+    Kind.SIDEKICK: ("{name} uses {ability}!", "{name} has no support ability."),
+    Kind.VILLAIN: ("{name} commits {ability}!", "{name} has no evil deed."),
+}
+
+
+class _SharedWeapon(Weapon):
+    """A Weapon shared between characters by _make_weapon; its stats cannot be changed."""
+
+    __slots__ = ()
+
+    def __setattr__(self, attr: str, value: object) -> None:
+        # Each slot may only be filled once, by Weapon.__init__
+        try:
+            getattr(self, attr)
+        except AttributeError:
+            super().__setattr__(attr, value)
+            return
+        raise AttributeError(f"Shared weapon '{self.name}' cannot be changed; equip a new Weapon instead")
+
+    def __delattr__(self, attr: str) -> None:
+        raise AttributeError(f"Shared weapon '{self.name}' cannot be changed; equip a new Weapon instead")
+
+
+@lru_cache(maxsize=256)
+def _make_weapon(name: str, damage: int) -> Weapon:
+    """
+    Get the shared Weapon for a name and damage pair.
+    
+    Characters created with the same weapon details share one read-only Weapon
+    instance, so changing it in place raises AttributeError.
+    """
+    return _SharedWeapon(name, f"A {name} weapon", damage)
+
 
 class Character:
     """
     Represents a game character with health, damage, and weapon attributes.
     
-    This class demonstrates encapsulation with private attributes and getter/setter methods.
+    This class demonstrates encapsulation with a private attribute exposed through a property.
     """
+
+    __slots__ = (
+        'name', '_health', '_damage', '_weapon', '_inventory', '_max_inventory_size',
+        'level', 'experience', '_effective_damage', 'kind', 'ability'
+    )
     
     def __init__(
         self, 
@@ -34,7 +91,9 @@ class Character:
         weapon_damage: int = 0,
         level: int = 1,
         experience: int = 0,
-        max_inventory_size: int = 10
+        max_inventory_size: int = 10,
+        kind: Kind = Kind.HERO,
+        ability: Optional[str] = None
     ) -> None:
         """
         Initialize a new Character.
@@ -48,16 +107,33 @@ class Character:
             level: The character's current level
             experience: The character's current experience points
             max_inventory_size: Maximum size of the character's inventory
+            kind: The kind of character, which decides how its ability is described
+            ability: The character's ability (optional)
         """
-        self.name = name
+        self.name = sys.intern(name)
         self._health = health
-        self.damage = damage
-        self.weapon = Weapon(weapon_name, f"A {weapon_name} weapon", weapon_damage) if weapon_name else None
-        self.inventory = Inventory(max_inventory_size)
+        self._damage = damage
+        self._weapon = _make_weapon(weapon_name, weapon_damage) if weapon_name else None
+        # The inventory is only created the first time it is accessed
+        self._max_inventory_size = max_inventory_size
+        self._inventory: Optional[Inventory] = None
         self.level = level
         self.experience = experience
+        self.kind = kind
+        self.ability = ability
+        self._recompute_damage()
+
+    # Property for health - provides controlled access to the private attribute
+    @property
+    def health(self) -> int:
+        """The character's current health."""
+        return self._health
+
+    # Setter with validation - ensures health is never negative
+    @health.setter
+    def health(self, new_health: int) -> None:
+        self._health = new_health if new_health > 0 else 0
 
-    # Getter for health - provides controlled access to the private attribute
     def get_health(self) -> int:
         """
         Get the character's current health.
@@ -65,9 +141,8 @@ class Character:
         Returns:
             The character's current health
         """
-        return self._health
+        return self.health
     
-    # Setter for health with validation - ensures health is never negative
     def set_health(self, new_health: int) -> None:
         """
         Set the character's health with validation.
@@ -75,10 +150,47 @@ class Character:
         Args:
             new_health: The new health value
         """
-        if new_health < 0:
-            self._health = 0
-        else:
-            self._health = new_health
+        self.health = new_health
+
+    # Property for the inventory - created lazily so unused inventories cost nothing
+    @property
+    def inventory(self) -> Inventory:
+        """The character's inventory."""
+        inventory = self._inventory
+        if inventory is None:
+            inventory = self._inventory = Inventory(self._max_inventory_size)
+        return inventory
+
+    # Property for base damage - changing it refreshes the cached attack damage
+    @property
+    def damage(self) -> int:
+        """The character's base damage, without any weapon bonus."""
+        return self._damage
+
+    @damage.setter
+    def damage(self, new_damage: int) -> None:
+        self._damage = new_damage
+        self._recompute_damage()
+
+    # Property for the weapon - re-equipping refreshes the cached attack damage
+    @property
+    def weapon(self) -> Optional[Weapon]:
+        """
+        The character's equipped weapon, if any.
+        
+        The weapon's bonus is cached when it is equipped. To change it, equip
+        a new Weapon; never change the damage of the equipped weapon in place.
+        """
+        return self._weapon
+
+    @weapon.setter
+    def weapon(self, new_weapon: Optional[Weapon]) -> None:
+        self._weapon = new_weapon
+        self._recompute_damage()
+
+    def _recompute_damage(self) -> None:
+        """Refresh the cached total damage (base damage plus weapon bonus)."""
+        self._effective_damage = self._damage + (self._weapon.damage if self._weapon else 0)
 
     # Method for the character to attack an enemy
     def attack(self, enemy: 'Character', logger: Optional[GameLogger] = None) -> tuple[int, bool]:
@@ -94,11 +206,10 @@ class Character:
             - The total damage dealt
             - A boolean indicating if the enemy was defeated
         """
-        total_damage = self.damage + (self.weapon.damage if self.weapon else 0)
-        # Use getter and setter instead of direct attribute access
-        current_health = enemy.get_health()
-        enemy.set_health(current_health - total_damage)
-        enemy_defeated = enemy.get_health() <= 0
+        total_damage = self._effective_damage
+        # The health property setter clamps the result at zero
+        enemy.health -= total_damage
+        enemy_defeated = enemy._health <= 0
         
         # Use the logger if provided (dependency), otherwise fall back to static method
         if logger:
@@ -132,35 +243,63 @@ class Character:
             return False
             
         self.experience += amount
-        leveled_up = False
+        levels = 0
+        # Split the new total into whole levels gained and leftover experience;
+        # a total below LEVEL_UP_EXP (including a negative one) is left as is
+        if self.experience >= LEVEL_UP_EXP:
+            levels, self.experience = divmod(self.experience, LEVEL_UP_EXP)
+        leveled_up = levels > 0
         
-        while self.experience >= LEVEL_UP_EXP:
-            # Store remaining experience after level up
-            remaining_exp = self.experience - LEVEL_UP_EXP
-            self.experience = remaining_exp
-            self.level += 1
-            self._health = int(self._health * EXP_MULTIPLIER)
-            self.damage = int(self.damage * EXP_MULTIPLIER)
-            leveled_up = True
+        if leveled_up:
+            # Stats are truncated after every level, so the result does not
+            # depend on how the experience was split across calls
+            base_level = self.level
+            health = self._health
+            damage = self._damage
+            entries = []
+            for step in range(1, levels + 1):
+                health = int(health * EXP_MULTIPLIER)
+                damage = int(damage * EXP_MULTIPLIER)
+                
+                # Log level up details for each level gained
+                if logger:
+                    entries.append(_LEVELUP_TPL.format(
+                        name=self.name,
+                        lvl=base_level + step,
+                        h=health,
+                        d=damage,
+                        rem=self.experience + (levels - step) * LEVEL_UP_EXP
+                    ))
+            self._health = health
+            self.damage = damage
+            self.level += levels
             
-            # Log level up details
             if logger:
-                logger.log(f"{self.name} leveled up to level {self.level}!")
-                logger.log(f"New stats: Health={self.get_health()}, Damage={self.damage}")
-                logger.log(f"Remaining experience: {remaining_exp}")
+                logger.log("\n".join(entries))
             
         if logger:
             logger.log(f"{self.name} gained {amount} experience points. Total: {self.experience}")
             
         return leveled_up
 
+    def perform_ability(self) -> str:
+        """
+        Use the character's ability.
+        
+        Returns:
+            A string describing the ability's effect
+        """
+        with_ability, without_ability = _ABILITY_MESSAGES[self.kind]
+        if self.ability:
+            return with_ability.format(name=self.name, ability=self.ability)
+        return without_ability.format(name=self.name)
+
     # Method to display character information
     def display(self) -> None:
         """Display the character's information."""
         weapon_name = self.weapon.name if self.weapon else 'No Weapon'
         weapon_damage = self.weapon.damage_bonus if self.weapon else 0
-        # Use getter instead of direct attribute access
-        print(f"Name: {self.name}\nHealth: {self.get_health()}\nDamage: {self.damage}\nWeapon: {weapon_name} (+{weapon_damage} Damage)")
+        print(f"Name: {self.name}\nHealth: {self.health}\nDamage: {self.damage}\nWeapon: {weapon_name} (+{weapon_damage} Damage)")
 
 
 class Boss(Character):
@@ -169,6 +308,8 @@ class Boss(Character):
     
     This class demonstrates inheritance and method overriding.
     """
+
+    __slots__ = ()
     
     def __init__(
         self, 
@@ -192,8 +333,19 @@ class Boss(Character):
             weapon_name: The name of the boss's weapon (optional)
             weapon_damage: The damage bonus of the boss's weapon
         """
-        super().__init__(name, health, damage, weapon_name, weapon_damage, level=level, experience=experience)
-        self.special_ability = special_ability
+        super().__init__(
+            name, health, damage, weapon_name, weapon_damage,
+            level=level, experience=experience, kind=Kind.BOSS, ability=special_ability
+        )
+
+    @property
+    def special_ability(self) -> Optional[str]:
+        """The boss's special ability, stored as its ability."""
+        return self.ability
+
+    @special_ability.setter
+    def special_ability(self, value: Optional[str]) -> None:
+        self.ability = value
 
     def use_special_ability(self) -> str:
         """
@@ -202,9 +354,7 @@ class Boss(Character):
         Returns:
             A string describing the special ability's effect
         """
-        if self.special_ability:
-            return f"{self.name} uses {self.special_ability}!"
-        return f"{self.name} has no special ability."
+        return self.perform_ability()
 
 class Sidekick(Character):
     """
@@ -212,6 +362,8 @@ class Sidekick(Character):
     
     This class demonstrates inheritance and additional helper methods.
     """
+
+    __slots__ = ()
     
     def __init__(
         self, 
@@ -235,8 +387,19 @@ class Sidekick(Character):
             weapon_damage: The damage bonus of the sidekick's weapon
             support_ability: The sidekick's support ability
         """
-        super().__init__(name, health, damage, weapon_name, weapon_damage, level=level, experience=experience)
-        self.support_ability = support_ability
+        super().__init__(
+            name, health, damage, weapon_name, weapon_damage,
+            level=level, experience=experience, kind=Kind.SIDEKICK, ability=support_ability
+        )
+
+    @property
+    def support_ability(self) -> Optional[str]:
+        """The sidekick's support ability, stored as its ability."""
+        return self.ability
+
+    @support_ability.setter
+    def support_ability(self, value: Optional[str]) -> None:
+        self.ability = value
 
     def use_support_ability(self) -> str:
         """
@@ -245,9 +408,7 @@ class Sidekick(Character):
         Returns:
             A string describing the support ability's effect
         """
-        if self.support_ability:
-            return f"{self.name} uses {self.support_ability}!"
-        return f"{self.name} has no support ability."
+        return self.perform_ability()
 
 class Villain(Character):
     """
@@ -255,6 +416,8 @@ class Villain(Character):
     
     This class demonstrates inheritance and additional malicious behaviors.
     """
+
+    __slots__ = ()
     
     def __init__(
         self, 
@@ -278,8 +441,19 @@ class Villain(Character):
             weapon_name: The name of the villain's weapon (optional)
             weapon_damage: The damage bonus of the villain's weapon
         """
-        super().__init__(name, health, damage, weapon_name, weapon_damage, level=level, experience=experience)
-        self.evil_deed = evil_deed
+        super().__init__(
+            name, health, damage, weapon_name, weapon_damage,
+            level=level, experience=experience, kind=Kind.VILLAIN, ability=evil_deed
+        )
+
+    @property
+    def evil_deed(self) -> Optional[str]:
+        """The villain's evil deed, stored as its ability."""
+        return self.ability
+
+    @evil_deed.setter
+    def evil_deed(self, value: Optional[str]) -> None:
+        self.ability = value
 
     def commit_evil_deed(self) -> str:
         """
@@ -288,6 +462,4 @@ class Villain(Character):
         Returns:
             A string describing the evil deed
         """
-        if self.evil_deed:
-            return f"{self.name} commits {self.evil_deed}!"
-        return f"{self.name} has no evil deed."
+        return self.perform_ability()
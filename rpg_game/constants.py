@@ -4,29 +4,45 @@ Constants for the RPG game.
 This module contains all the constant values used throughout the game.
 """
 
+import sys
 from typing import Final
 
+
+def _split_template(template: str, field: str) -> tuple[str, str]:
+    """
+    Split a message template around its single placeholder.
+    
+    Args:
+        template: A message containing exactly one {field} placeholder
+        field: The placeholder name
+        
+    Returns:
+        The text before and after the placeholder
+    """
+    prefix, suffix = template.split("{" + field + "}")
+    return prefix, suffix
+
 # Player constants
 PLAYER_INITIAL_HEALTH: Final[int] = 110
 PLAYER_INITIAL_DAMAGE: Final[int] = 10
 
 # Boss constants
-GOBLIN_KING_NAME: Final[str] = "Goblin King"
+GOBLIN_KING_NAME: Final[str] = sys.intern("Goblin King")
 GOBLIN_KING_HEALTH: Final[int] = 50
 GOBLIN_KING_DAMAGE: Final[int] = 8
 
-DARK_SORCERER_NAME: Final[str] = "Dark Sorcerer"
+DARK_SORCERER_NAME: Final[str] = sys.intern("Dark Sorcerer")
 DARK_SORCERER_HEALTH: Final[int] = 60
 DARK_SORCERER_DAMAGE: Final[int] = 9
 
 # Weapon constants
-WEAPON_ROCK_NAME: Final[str] = "Rock"
+WEAPON_ROCK_NAME: Final[str] = sys.intern("Rock")
 WEAPON_ROCK_DAMAGE: Final[int] = 2
 
-WEAPON_PAPER_NAME: Final[str] = "Paper"
+WEAPON_PAPER_NAME: Final[str] = sys.intern("Paper")
 WEAPON_PAPER_DAMAGE: Final[int] = 3
 
-WEAPON_SCISSORS_NAME: Final[str] = "Scissors"
+WEAPON_SCISSORS_NAME: Final[str] = sys.intern("Scissors")
 WEAPON_SCISSORS_DAMAGE: Final[int] = 4
 
 # UI constants
@@ -85,3 +101,12 @@ GAME_OVER_MESSAGE = (
     "Though darkness prevails this day, the spirit of a true hero never fades.\n"
     "Rest and return, {player_name}—the world still needs you. Your next adventure awaits!"
 )
+
+# Pre-split messages: join as prefix + value + suffix instead of re-parsing with str.format
+INTRO_MESSAGE_PARTS: Final[tuple[str, str]] = _split_template(INTRO_MESSAGE, "player_name")
+GOBLIN_KING_INTRO_PARTS: Final[tuple[str, str]] = _split_template(GOBLIN_KING_INTRO, "player_name")
+DARK_SORCERER_INTRO_PARTS: Final[tuple[str, str]] = _split_template(DARK_SORCERER_INTRO, "player_name")
+VICTORY_MESSAGE_PARTS: Final[tuple[str, str]] = _split_template(VICTORY_MESSAGE, "enemy_name")
+DEFEAT_MESSAGE_PARTS: Final[tuple[str, str]] = _split_template(DEFEAT_MESSAGE, "enemy_name")
+GAME_WIN_MESSAGE_PARTS: Final[tuple[str, str]] = _split_template(GAME_WIN_MESSAGE, "player_name")
+GAME_OVER_MESSAGE_PARTS: Final[tuple[str, str]] = _split_template(GAME_OVER_MESSAGE, "player_name")
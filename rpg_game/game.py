@@ -3,13 +3,8 @@ Game module for the RPG game.
 
 This module contains the Game class that manages the game flow.
 """
-import sys
-import os
 from typing import List, Tuple, Optional
 
-# Add the project directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from rpg_game.character import Character, Boss
 from rpg_game.utils.logger import GameLogger
 from rpg_game.utils.console import clear_screen, press_enter, print_border
@@ -26,15 +21,29 @@ from rpg_game.constants import (
     # UI constants
     SEPARATOR_LENGTH, BORDER_LENGTH,
     # Game messages
-    WELCOME_MESSAGE, INTRO_MESSAGE,
+    WELCOME_MESSAGE, INTRO_MESSAGE_PARTS,
     # Level messages
-    GOBLIN_KING_INTRO, DARK_SORCERER_INTRO,
+    GOBLIN_KING_INTRO_PARTS, DARK_SORCERER_INTRO_PARTS,
     # Combat messages
-    VICTORY_MESSAGE, DEFEAT_MESSAGE,
-    GAME_WIN_MESSAGE, GAME_OVER_MESSAGE
+    VICTORY_MESSAGE_PARTS, DEFEAT_MESSAGE_PARTS,
+    GAME_WIN_MESSAGE_PARTS, GAME_OVER_MESSAGE_PARTS
 )
 
 
+def fill_message(parts: Tuple[str, str], value: str) -> str:
+    """
+    Insert a value into a pre-split message template.
+    
+    Args:
+        parts: The text before and after the placeholder
+        value: The value to insert
+        
+    Returns:
+        The completed message
+    """
+    return parts[0] + value + parts[1]
+
+
 class Game:
     """
     Manages the game flow, including character creation, combat, and game state.
@@ -55,7 +64,7 @@ class Game:
         clear_screen()
         print(WELCOME_MESSAGE)
         player_name = input("Enter your character's name: ").capitalize()
-        print(INTRO_MESSAGE.format(player_name=player_name))
+        print(fill_message(INTRO_MESSAGE_PARTS, player_name))
         self.setup_game(player_name)
 
     # Set up the game by creating the player character and bosses
@@ -127,19 +136,19 @@ class Game:
         Returns:
             True if the player won, False otherwise
         """
-        while player.get_health() > 0 and enemy.get_health() > 0:
+        while player.health > 0 and enemy.health > 0:
             self.display_combat_status(player, enemy)
             # Pass the logger to the attack methods
             damage_dealt = player.attack(enemy, self.logger)
             print(f"You dealt {damage_dealt} damage to {enemy.name}.")
-            if enemy.get_health() <= 0:
+            if enemy.health <= 0:
                 self.print_victory_message(enemy)
                 return True
 
             # Pass the logger to the attack methods
             damage_received = enemy.attack(player, self.logger)
             print(f"{enemy.name} dealt {damage_received} damage to you.")
-            if player.get_health() <= 0:
+            if player.health <= 0:
                 self.print_defeat_message(enemy)
                 return False
             press_enter()
@@ -181,10 +190,11 @@ class Game:
         """
         clear_screen()
         intro_messages = {
-            GOBLIN_KING_NAME: GOBLIN_KING_INTRO.format(player_name=self.player.name),
-            DARK_SORCERER_NAME: DARK_SORCERER_INTRO.format(player_name=self.player.name)
+            GOBLIN_KING_NAME: GOBLIN_KING_INTRO_PARTS,
+            DARK_SORCERER_NAME: DARK_SORCERER_INTRO_PARTS
         }
-        print(intro_messages.get(boss.name, "A new boss appears!"))
+        intro_parts = intro_messages.get(boss.name)
+        print(fill_message(intro_parts, self.player.name) if intro_parts else "A new boss appears!")
         press_enter()
 
     # Print victory message after defeating an enemy
@@ -196,7 +206,7 @@ class Game:
             enemy: The defeated enemy
         """
         print_border()
-        print(VICTORY_MESSAGE.format(enemy_name=enemy.name))
+        print(fill_message(VICTORY_MESSAGE_PARTS, enemy.name))
         press_enter()
 
     # Print defeat message after being defeated by an enemy
@@ -208,7 +218,7 @@ class Game:
             enemy: The enemy that defeated the player
         """
         print_border()
-        print(DEFEAT_MESSAGE.format(enemy_name=enemy.name))
+        print(fill_message(DEFEAT_MESSAGE_PARTS, enemy.name))
         press_enter()
 
     # End the game and show final message
@@ -221,9 +231,9 @@ class Game:
         """
         print_border()
         if player_won:
-            print(GAME_WIN_MESSAGE.format(player_name=self.player.name))
+            print(fill_message(GAME_WIN_MESSAGE_PARTS, self.player.name))
         else:
-            print(GAME_OVER_MESSAGE.format(player_name=self.player.name))
+            print(fill_message(GAME_OVER_MESSAGE_PARTS, self.player.name))
         print_border()
 
     # Run the game
@@ -1,27 +1,41 @@
 """
 Inventory system for managing items and equipment.
 """
+import sys
+from typing import Iterator
 
 class Item:
     """Base class for all items."""
+
+    __slots__ = ('name', 'description')
+
     def __init__(self, name: str, description: str):
-        self.name = name
+        self.name = sys.intern(name)
         self.description = description
 
 class Weapon(Item):
     """Weapon item that can be equipped."""
+
+    __slots__ = ('damage',)
+
     def __init__(self, name: str, description: str, damage: int):
         super().__init__(name, description)
         self.damage = damage
 
 class Armor(Item):
     """Armor item that provides defense."""
+
+    __slots__ = ('defense',)
+
     def __init__(self, name: str, description: str, defense: int):
         super().__init__(name, description)
         self.defense = defense
 
 class Consumable(Item):
     """Consumable item that provides temporary effects."""
+
+    __slots__ = ('effect', 'value')
+
     def __init__(self, name: str, description: str, effect: str, value: int):
         super().__init__(name, description)
         self.effect = effect
@@ -29,45 +43,57 @@ class Consumable(Item):
 
 class Inventory:
     """Manages a character's items and equipment."""
+
+    __slots__ = ('max_size', 'items', 'equipped_weapon', 'equipped_armor')
+
     def __init__(self, max_size: int = 10):
         self.max_size = max_size
-        self.items: list[Item] = []
+        # Items are keyed by identity for constant-time lookup and removal
+        self.items: dict[int, Item] = {}
         self.equipped_weapon: Weapon | None = None
         self.equipped_armor: Armor | None = None
 
+    def __iter__(self) -> Iterator[Item]:
+        """Iterate over the items in the inventory."""
+        return iter(self.items.values())
+
+    def __len__(self) -> int:
+        """Return the number of items in the inventory."""
+        return len(self.items)
+
+    def __contains__(self, item: Item) -> bool:
+        """Check whether an item is in the inventory."""
+        return id(item) in self.items
+
     def add_item(self, item: Item) -> bool:
-        """Add an item to the inventory."""
-        if len(self.items) >= self.max_size:
+        """Add an item to the inventory. An item that is already held is not added again."""
+        if len(self.items) >= self.max_size or id(item) in self.items:
             return False
-        self.items.append(item)
+        self.items[id(item)] = item
         return True
 
     def remove_item(self, item: Item) -> bool:
         """Remove an item from the inventory."""
-        if item in self.items:
-            self.items.remove(item)
-            return True
-        return False
+        return self.items.pop(id(item), None) is not None
 
     def equip_weapon(self, weapon: Weapon) -> bool:
         """Equip a weapon."""
-        if weapon in self.items:
+        if id(weapon) in self.items:
             self.equipped_weapon = weapon
             return True
         return False
 
     def equip_armor(self, armor: Armor) -> bool:
         """Equip armor."""
-        if armor in self.items:
+        if id(armor) in self.items:
             self.equipped_armor = armor
             return True
         return False
 
     def use_consumable(self, consumable: Consumable) -> bool:
         """Use a consumable item."""
-        if consumable in self.items:
+        if self.items.pop(id(consumable), None) is not None:
             # Apply the consumable's effect
             # This would be implemented in the game logic
-            self.items.remove(consumable)
             return True
         return False
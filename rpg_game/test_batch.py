@@ -0,0 +1,45 @@
+import unittest
+from rpg_game.character import Character, LEVEL_UP_EXP
+
+try:
+    import numpy as np
+    from rpg_game.batch import CharacterBatch
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestCharacterBatch(unittest.TestCase):
+    def setUp(self):
+        self.heroes = CharacterBatch.from_characters([
+            Character("Hero 1", 100, 10, "Sword", 5),
+            Character("Hero 2", 80, 7),
+        ])
+        self.enemies = CharacterBatch.from_characters([
+            Character("Goblin", 20, 3),
+            Character("Orc", 50, 6),
+        ])
+
+    def test_attack(self):
+        defeated = self.heroes.attack(self.enemies, np.array([0, 1]), np.array([0, 0]))
+        self.assertEqual(self.enemies.health.tolist(), [0, 50])
+        self.assertEqual(defeated.tolist(), [True, False])
+
+    def test_gain_experience_matches_character(self):
+        hero = Character("Hero 1", 100, 10, "Sword", 5)
+        hero.gain_experience(4 * LEVEL_UP_EXP + 30)
+
+        leveled_up = self.heroes.gain_experience(np.array([4 * LEVEL_UP_EXP + 30, 50]))
+        self.assertEqual(leveled_up.tolist(), [True, False])
+        self.assertEqual(self.heroes.level.tolist(), [hero.level, 1])
+        self.assertEqual(self.heroes.experience.tolist(), [hero.experience, 50])
+        self.assertEqual(self.heroes.health[0], hero.get_health())
+        self.assertEqual(self.heroes.damage[0], hero.damage)
+
+    def test_gain_experience_accepts_float_amounts(self):
+        self.heroes.gain_experience(LEVEL_UP_EXP + 0.5)
+        self.assertEqual(self.heroes.level.tolist(), [2, 2])
+        self.assertEqual(self.heroes.experience.tolist(), [0, 0])
+
+if __name__ == '__main__':
+    unittest.main()
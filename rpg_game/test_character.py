@@ -1,7 +1,9 @@
-import unittest
 import io
-import sys
-from rpg_game.character import Character, Boss, Sidekick, Villain, LEVEL_UP_EXP
+import time
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+from rpg_game.character import Character, Boss, Sidekick, Villain, Kind, LEVEL_UP_EXP
 from rpg_game.inventory import Item, Weapon, Armor, Consumable, Inventory
 from rpg_game.utils.logger import GameLogger
 
@@ -49,6 +51,53 @@ class TestCharacter(unittest.TestCase):
         self.assertEqual(self.character.damage, 10)
         self.assertIsNotNone(self.character.weapon)
 
+    def test_characters_share_weapon_instances(self):
+        other = Character("Other", 100, 10, weapon_name="Test Sword", weapon_damage=5)
+        self.assertIs(other.weapon, self.character.weapon)
+        self.assertEqual(other.weapon.description, "A Test Sword weapon")
+
+    def test_shared_weapon_cannot_be_changed(self):
+        other = Character("Other", 100, 10, weapon_name="Test Sword", weapon_damage=5)
+        with self.assertRaises(AttributeError):
+            self.character.weapon.damage = 20
+        
+        # Equipping a new weapon does not affect other characters or the cache
+        self.character.weapon = Weapon("Test Sword", "A sharper sword", 20)
+        enemy = Character("Enemy", 100, 10)
+        self.assertEqual(self.character.attack(enemy)[0], 30)
+        self.assertEqual(other.weapon.damage, 5)
+        self.assertEqual(other.attack(enemy)[0], 15)
+        newcomer = Character("Newcomer", 100, 10, weapon_name="Test Sword", weapon_damage=5)
+        self.assertEqual(newcomer.weapon.damage, 5)
+
+    def test_health_property(self):
+        self.character.health = 40
+        self.assertEqual(self.character.health, 40)
+        self.assertEqual(self.character.get_health(), 40)
+        
+        # Health is clamped at zero
+        self.character.health -= 100
+        self.assertEqual(self.character.health, 0)
+        self.character.set_health(-5)
+        self.assertEqual(self.character.get_health(), 0)
+
+    def test_weapon_change_updates_attack_damage(self):
+        enemy = Character("Enemy", 100, 10)
+        self.character.weapon = Weapon("Axe", "A heavy axe", 20)
+        damage, _ = self.character.attack(enemy)
+        self.assertEqual(damage, 30)
+        
+        self.character.weapon = None
+        damage, _ = self.character.attack(enemy)
+        self.assertEqual(damage, 10)
+
+    def test_damage_change_updates_attack_damage(self):
+        enemy = Character("Enemy", 100, 10)
+        self.character.damage = 50
+        damage, _ = self.character.attack(enemy)
+        self.assertEqual(damage, 55)  # Base damage 50 + weapon damage 5
+        self.assertEqual(enemy.get_health(), 45)
+
     def test_experience_system(self):
         # Test initial state
         self.assertEqual(self.character.experience, 0)
@@ -97,53 +146,70 @@ class TestCharacter(unittest.TestCase):
         self.assertEqual(self.character.experience, initial_exp)  # Should remain unchanged
         
         # Test logging functionality
-        logger = GameLogger()
-        
-        # Capture stdout for logging
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
+        logger = GameLogger(log_to_console=False)
         
         # Gain experience with logging
         self.character.gain_experience(LEVEL_UP_EXP, logger)
         
-        # Restore stdout
-        sys.stdout = sys.__stdout__
-        
         # Check logs
-        logs = captured_output.getvalue()
+        logs = "\n".join(logger.get_logs())
         self.assertIn("Test Character leveled up to level", logs)
         
     def test_logging(self):
         """Test the logging functionality during combat and level up."""
-        logger = GameLogger()
+        logger = GameLogger(log_to_console=False)
         
         # Test combat logging
         enemy = Character("Enemy", 100, 10)
         
-        # Capture the output
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-        
         # Test combat logging
         self.character.attack(enemy, logger)
         
         # Test level up logging
         self.character.gain_experience(LEVEL_UP_EXP, logger)
         
-        # Restore stdout
-        sys.stdout = sys.__stdout__
-        
         # Check logs
-        logs = captured_output.getvalue()
+        logs = "\n".join(logger.get_logs())
         self.assertIn(self.character.name, logs)
         self.assertIn(enemy.name, logs)
         self.assertIn("Test Character leveled up to level", logs)
         self.assertIn("New stats:", logs)
 
+    def test_logger_records_messages(self):
+        logger = GameLogger(log_to_console=False, max_logs=2)
+        logger.log("first")
+        logger.log("second")
+        logger.log("third")
+        # Only the most recent messages are kept
+        self.assertEqual(logger.get_logs(), ["second", "third"])
+
+    def test_disabled_logger_skips_combat_log(self):
+        logger = GameLogger(log_to_console=False, max_logs=0)
+        enemy = Character("Enemy", 100, 10)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            logger.log_combat(self.character, enemy, 15)
+        self.assertEqual(logger.get_logs(), [])
+        self.assertEqual(output.getvalue(), "")
+
+    def test_combat_log_reuses_timestamp_within_a_second(self):
+        logger = GameLogger(log_to_console=False)
+        enemy = Character("Enemy", 100, 10)
+        with mock.patch.object(time, "time", side_effect=[1000.1, 1000.9]), \
+                mock.patch.object(time, "strftime", wraps=time.strftime) as strftime:
+            logger.log_combat(self.character, enemy, 15)
+            logger.log_combat(self.character, enemy, 15)
+        self.assertEqual(strftime.call_count, 1)
+        first, second = logger.get_logs()
+        self.assertEqual(first, second)
+
+    def test_unbounded_logger_records_combat(self):
+        logger = GameLogger(log_to_console=False, max_logs=None)
+        enemy = Character("Enemy", 100, 10)
+        self.character.attack(enemy, logger)
+        self.assertEqual(len(logger.get_logs()), 1)
+        self.assertIn("COMBAT LOG: Test Character attacked Enemy", logger.get_logs()[0])
+
     def test_inventory(self):
         # Test adding items
         sword = Weapon("Sword", "A sharp sword", 10)
@@ -159,6 +225,37 @@ class TestCharacter(unittest.TestCase):
         self.assertTrue(self.character.inventory.equip_armor(armor))
         self.assertTrue(self.character.inventory.use_consumable(potion))
 
+        # Used consumables are removed from the inventory
+        self.assertEqual(list(self.character.inventory), [sword, armor])
+        self.assertFalse(self.character.inventory.use_consumable(potion))
+
+        # Test removing items
+        self.assertTrue(self.character.inventory.remove_item(armor))
+        self.assertFalse(self.character.inventory.remove_item(armor))
+        self.assertNotIn(armor, self.character.inventory)
+        self.assertEqual(len(self.character.inventory), 1)
+
+    def test_inventory_created_on_access(self):
+        character = Character("Lazy", 100, 10, max_inventory_size=3)
+        self.assertIsNone(character._inventory)
+        self.assertEqual(character.inventory.max_size, 3)
+        self.assertIs(character.inventory, character.inventory)
+
+    def test_inventory_full(self):
+        inventory = Inventory(max_size=2)
+        self.assertTrue(inventory.add_item(Item("Rope", "A coil of rope")))
+        self.assertTrue(inventory.add_item(Item("Torch", "A wooden torch")))
+        self.assertFalse(inventory.add_item(Item("Map", "An old map")))
+
+    def test_inventory_rejects_duplicate_item(self):
+        inventory = Inventory()
+        rope = Item("Rope", "A coil of rope")
+        self.assertTrue(inventory.add_item(rope))
+        self.assertFalse(inventory.add_item(rope))
+        self.assertEqual(len(inventory), 1)
+        self.assertTrue(inventory.remove_item(rope))
+        self.assertEqual(len(inventory), 0)
+
     def test_boss_special_ability(self):
         special_ability = "Fireball"
         self.boss = Boss("Test Boss", 150, 20, special_ability)
@@ -177,6 +274,34 @@ class TestCharacter(unittest.TestCase):
         self.assertGreater(self.character.get_health(), 100)
         self.assertGreater(self.character.damage, 10)
 
+    def test_multi_level_up_scaling(self):
+        self.character.gain_experience(3 * LEVEL_UP_EXP + 40)
+        self.assertEqual(self.character.level, 4)
+        self.assertEqual(self.character.experience, 40)
+        self.assertEqual(self.character.get_health(), 172)  # 100 -> 120 -> 144 -> 172
+        self.assertEqual(self.character.damage, 16)  # 10 -> 12 -> 14 -> 16
+
+    def test_negative_starting_experience(self):
+        character = Character("Debtor", 100, 10, experience=-50)
+        self.assertFalse(character.gain_experience(10))
+        self.assertEqual(character.experience, -40)
+        self.assertEqual(character.level, 1)
+
+    def test_level_up_independent_of_experience_split(self):
+        single = Character("Single", 110, 10)
+        single.gain_experience(4 * LEVEL_UP_EXP)
+        
+        split = Character("Split", 110, 10)
+        for _ in range(4):
+            split.gain_experience(LEVEL_UP_EXP)
+        
+        self.assertEqual(single.get_health(), 226)
+        self.assertEqual(single.damage, 19)
+        self.assertEqual(
+            (single.level, single.experience, single.get_health(), single.damage),
+            (split.level, split.experience, split.get_health(), split.damage)
+        )
+
     def test_character_attack_with_experience(self):
         # Create a test enemy with higher health than damage
         enemy = Character(
@@ -216,17 +341,12 @@ class TestCharacter(unittest.TestCase):
                 self.assertLessEqual(self.character.experience, LEVEL_UP_EXP)
                 
                 # Verify experience gain is logged
-                # Capture stdout
-                captured_output = io.StringIO()
-                sys.stdout = captured_output
-                sys.stdout.flush()
-                
                 # Attack again to get logs
-                self.character.attack(enemy, GameLogger())
-                sys.stdout = sys.__stdout__
+                logger = GameLogger(log_to_console=False)
+                self.character.attack(enemy, logger)
                 
                 # Get and verify logs
-                logs = captured_output.getvalue()
+                logs = "\n".join(logger.get_logs())
                 self.assertIn("Test Character gained 100 experience points", logs)
                 self.assertIn("Total experience: 100", logs)
                 
@@ -257,7 +377,7 @@ class TestCharacter(unittest.TestCase):
         initial_damage = self.character.damage
         
         # Test experience gain with logger
-        logger = GameLogger()
+        logger = GameLogger(log_to_console=False)
         
         # Create a new enemy for the next test
         new_enemy = Character("Test Enemy 2", 150, 10)
@@ -265,24 +385,14 @@ class TestCharacter(unittest.TestCase):
         # Verify experience before attack
         self.assertEqual(self.character.experience, LEVEL_UP_EXP)
         
-        # Capture stdout for logging
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-        sys.stdout.flush()  # Ensure all output is captured
-        
         # Attack new enemy with logging to gain experience
         self.character.attack(new_enemy, logger)
         
         # Verify experience gain after defeating new enemy
         self.assertEqual(self.character.experience, LEVEL_UP_EXP)  # Should still have LEVEL_UP_EXP since we level up
         
-        # Restore stdout
-        sys.stdout = sys.__stdout__
-        
         # Check logs
-        logs = captured_output.getvalue()
+        logs = "\n".join(logger.get_logs())
         self.assertIn("Test Character gained 100 experience points", logs)
         self.assertIn("Test Character leveled up to level", logs)
         self.assertIn("New stats:", logs)
@@ -292,6 +402,23 @@ class TestCharacter(unittest.TestCase):
         self.assertGreater(self.character.get_health(), initial_health)
         self.assertGreater(self.character.damage, initial_damage)
 
+    def test_perform_ability(self):
+        self.assertEqual(self.villain.kind, Kind.VILLAIN)
+        self.assertEqual(self.villain.perform_ability(), "Test Villain commits Steal!")
+        
+        # A plain Character can be tagged with a kind directly
+        villain = Character("Rogue", 50, 5, kind=Kind.VILLAIN, ability="Pickpocket")
+        self.assertEqual(villain.perform_ability(), "Rogue commits Pickpocket!")
+        self.assertEqual(self.character.perform_ability(), "Test Character has no ability.")
+        
+        # Every kind has its own messages
+        for kind in Kind:
+            tagged = Character("Tagged", 50, 5, kind=kind)
+            self.assertIn("Tagged has no", tagged.perform_ability())
+        
+        self.sidekick.support_ability = None
+        self.assertEqual(self.sidekick.use_support_ability(), "Test Sidekick has no support ability.")
+
     def test_sidekick_support_ability(self):
         self.assertEqual(self.sidekick.use_support_ability(), "Test Sidekick uses Heal!")
 
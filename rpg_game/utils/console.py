@@ -1,13 +1,7 @@
 """
 Console utility functions for the RPG game.
 """
-import sys
 import os
-from typing import Any
-
-# Add the project directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 
 
 def clear_screen() -> None:
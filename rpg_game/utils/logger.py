@@ -1,14 +1,9 @@
 """
 Logger module for the RPG game.
 """
-import sys
-import os
-import datetime
-from typing import Any
-
-# Add the project directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
+import time
+from collections import deque
+from typing import Any, Optional
 
 
 class GameLogger:
@@ -18,15 +13,20 @@ class GameLogger:
     This class demonstrates association relationship with Game (solid line in UML).
     """
     
-    def __init__(self, log_to_console: bool = True) -> None:
+    def __init__(self, log_to_console: bool = True, max_logs: Optional[int] = 10_000) -> None:
         """
         Initialize a new GameLogger.
         
         Args:
             log_to_console: Whether to print logs to the console
+            max_logs: How many recent messages to keep (0 disables recording, None keeps all)
         """
         self.log_to_console = log_to_console
-        self.logs = []  # Store all log messages
+        # Store the most recent log messages; older ones are dropped
+        self.logs: deque[str] = deque(maxlen=max_logs)
+        # Cached "%H:%M:%S" timestamp, reformatted at most once per second
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
         
     def log(self, message: str) -> None:
         """
@@ -35,10 +35,24 @@ class GameLogger:
         Args:
             message: The message to log
         """
+        self.logs.append(message)
         if self.log_to_console:
             print(message)
         # Future enhancement: could log to file, database, etc.
 
+    def _timestamp(self) -> str:
+        """
+        Get the current time formatted for log messages.
+        
+        Returns:
+            The current time as HH:MM:SS
+        """
+        sec = int(time.time())
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        return self._last_ts_str
+
     def log_combat(self, attacker: Any, defender: Any, damage: int) -> None:
         """
         Log a combat event.
@@ -48,9 +62,10 @@ class GameLogger:
             defender: The defending character
             damage: The amount of damage dealt
         """
-        # Get current time for the log
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] COMBAT LOG: {attacker.name} attacked {defender.name} for {damage} damage"
+        # Nothing would be shown or recorded, so skip building the message
+        if not self.log_to_console and self.logs.maxlen == 0:
+            return
+        log_message = f"[{self._timestamp()}] COMBAT LOG: {attacker.name} attacked {defender.name} for {damage} damage"
         self.log(log_message)
 
     def log_level_up(self, character: Any) -> None:
@@ -60,15 +75,16 @@ class GameLogger:
         Args:
             character: The character that leveled up
         """
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] LEVEL UP: {character.name} reached level {character.level}!"
+        if not self.log_to_console and self.logs.maxlen == 0:
+            return
+        log_message = f"[{self._timestamp()}] LEVEL UP: {character.name} reached level {character.level}!"
         self.log(log_message)
 
-    def get_logs(self) -> list:
+    def get_logs(self) -> list[str]:
         """
-        Get all logged messages.
+        Get all recorded log messages.
         
         Returns:
-            A list of logged messages
+            A list of recorded messages, oldest first
         """
-        return self.logs
+        return list(self.logs)
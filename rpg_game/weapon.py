@@ -2,12 +2,6 @@
 Weapon module for the RPG game.
 """
 import sys
-import os
-from typing import Optional
-
-# Add the project directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 
 
 class Weapon:
@@ -25,5 +19,5 @@ class Weapon:
             name: The name of the weapon
             damage_bonus: The additional damage this weapon provides
         """
-        self.name = name
+        self.name = sys.intern(name)
         self.damage_bonus = damage_bonus